@@ -8,9 +8,16 @@ This script:
 - Writes the output as a .ttl file.
 """
 
+import os
+import sys
+
 import pandas as pd
 from rdflib import Graph, Namespace, Literal, RDF, URIRef
 from rdflib.namespace import RDFS, DCTERMS, XSD, FOAF, OWL, SKOS
+from rdflib.plugins.stores.memory import SimpleMemory
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+from rimo_vocab import TOOL_TYPES, TARGET_GROUPS, AUTOMATION_TOOLS, ALIAS_MAP, term, register_vocab
 
 
 # === CONFIGURATION ===
@@ -24,8 +31,8 @@ EDAM = Namespace("http://edamontology.org/")
 NCIT = Namespace("http://purl.obolibrary.org/obo/NCIT_")
 OBO  = Namespace("http://purl.obolibrary.org/obo/")  # for EVALO
 
-# Initialize RDF graph
-g = Graph()
+# Initialize RDF graph; only written out, never queried
+g = Graph(store=SimpleMemory())
 g.bind("rimo", BASE)
 g.bind("rdfs", RDFS)
 g.bind("dct", DCTERMS)
@@ -73,31 +80,12 @@ for cid, label in [("Mandatory","Mandatory indicator"),
     g.add((c, SKOS.prefLabel, Literal(label, lang="en")))
     g.add((c, SKOS.inScheme, BASE.RequirementLevel))
 
-# Define a set of tool types
-tool_types = {
-    "Bioinformatics portal": "web site providing a platform/portal to multiple resources used for research in a focused area, including biological databases, web applications, training resources and so on.",
-    "Command-line tool": "A tool with a text-based (command-line) interface.",
-    "Database portal": "A Web application, suite or workbench providing a portal to a biological database.",
-    "Desktop application": "A tool with a graphical user interface that runs on your desktop environment, e.g. on a PC or mobile device.",
-    "Library": "A collection of components that are used to construct other tools. bio.tools scope includes component libraries performing high-level bioinformatics functions but excludes lower-level programming libraries.",
-    "Ontology": "A collection of information about concepts, including terms, synonyms, descriptions etc.",
-    "Plug-in": "A software component encapsulating a set of related functions, which are not standalone, i.e. depend upon other software for its use, e.g. a Javascript widget, or a plug-in, extension add-on etc. that extends the function of some existing tool.",
-    "Script": "A tool written for some run-time environment (e.g. other applications or an OS shell) that automates the execution of tasks. Often a small program written in a general-purpose languages (e.g. Perl, Python) or some domain-specific languages (e.g. sed).",
-    "SPARQL endpoint": "A service that provides queries over an RDF knowledge base via the SPARQL query language and protocol, and returns results via HTTP.",
-    "Suite": "A collection of tools which are bundled together into a convenient toolkit. Such tools typically share related functionality, a common user interface and can exchange data conveniently. This includes collections of stand-alone command-line tools, or Web applications within a common portal.",
-    "Web application": "A tool with a graphical user interface that runs in your Web browser.",
-    "Web API": "An application programming interface (API) consisting of endpoints to a request-response message system accessible via HTTP. Includes everything from simple data-access URLs to RESTful APIs.",
-    "Web service": "An API described in a machine readable form (typically WSDL) providing programmatic access via SOAP over HTTP.",
-    "Workbench": "An application or suite with a graphical user interface, providing an integrated environment for data analysis which includes or may be extended with any number of functions or tools. Includes workflow systems, platforms, frameworks etc.",
-    "Workflow": "A set of tools which have been composed together into a pipeline of some sort. Such tools are (typically) standalone, but are composed for convenience, for instance for batch execution via some workflow engine or script.",
-    "Helpdesk": "A service providing assistance with the use of bioinformatics tools, data resources, or any other aspect of bioinformatics.",
-}
-for tool_type, description in tool_types.items():
-    tool_uri = BASE[tool_type.replace(" ", "_")]
-    g.add((tool_uri, RDF.type, BASE.ServiceCategory))
-    g.add((tool_uri, RDFS.label, Literal(tool_type, lang="en")))
-    g.add((tool_uri, RDFS.comment, Literal(description, lang="en")))
-
+# Service categories, target groups and automation tools
+register_vocab(g, BASE)
+SERVICE_CAT_URIS = {term(BASE, k) for k in TOOL_TYPES}
+SERVICE_CAT_ALIASES = {k: [BASE[n] for n in v] for k, v in ALIAS_MAP.items()}
+TARGET_GROUP_URIS = {term(BASE, k) for k in TARGET_GROUPS}
+AUTOMATION_TOOL_URIS = {term(BASE, k) for k in AUTOMATION_TOOLS}
 
 def mapToolType(service_category):
     """Map service category to ontology terms."""
@@ -105,36 +93,11 @@ def mapToolType(service_category):
         return None
     service_category = service_category.strip()
     tool_uri = BASE[service_category.replace(" ", "_")]
-    if (tool_uri, RDF.type, BASE.ServiceCategory) in g:
+    if tool_uri in SERVICE_CAT_URIS:
         return [tool_uri]
-    if service_category == "Web applications":
-        return [BASE.Web_application]
-    if service_category == "Database":
-        return [BASE.Database_portal]
-    if service_category == "Libraries / APIs":
-        return [BASE.Library, BASE.Web_API]
-    if service_category == "Support / Consulting":
-        return [BASE.Helpdesk]
-    if service_category == "Tools/ Applications":
-        return [BASE.Desktop_application]
-    if service_category == "Workflows / pipelines":
-        return [BASE.Workflow]
-    return None
+    return SERVICE_CAT_ALIASES.get(service_category, None)
+
 
-# add Target Group terms
-target_groups = {
-    "Funding Agency": "An organization that provides funding for research activities.",
-    "Service Provider": "An organization or individual that offers services to users or clients.",
-    "End User": "The individual or group that ultimately uses or is intended to use a product or service.",
-    "Network": "A group or system of interconnected people or organizations that collaborate or share resources.",
-    "Technical": "Individuals or teams responsible for the technical aspects of service delivery, including maintenance and support.",
-}
-for group, description in target_groups.items():
-    group_uri = BASE[group.replace(" ", "_")]
-    g.add((group_uri, RDF.type, FOAF.Group))
-    g.add((group_uri, RDFS.label, Literal(group, lang="en")))
-    g.add((group_uri, RDFS.comment, Literal(description, lang="en")))
-    
 def mapTargetGroup(target_group):
     """Map target group to ontology terms."""
     if pd.isna(target_group):
@@ -144,33 +107,18 @@ def mapTargetGroup(target_group):
     for group in target_group:
         group = group.strip()
         group_uri = BASE[group.replace(" ", "_")]
-        if (group_uri, RDF.type, FOAF.Group) in g:
+        if group_uri in TARGET_GROUP_URIS:
             groups.append(group_uri)
     return groups if groups else None
         
-automation_tools = {
-    "Matomo": "An open-source web analytics platform.",
-    "Google Analytics": "A web analytics service offered by Google that tracks and reports website traffic.",
-    "Bioconductor": "An open-source software project for the analysis and comprehension of genomic data.",
-    "Galaxy": "An open, web-based platform for data-intensive biomedical research.",
-    "GitHub": "A web-based platform used for version control and collaborative software development.",
-    "Custom scripts": "User-defined scripts created for specific tasks or analyses.",
-    "OpenAlex": "An open catalog of the global research system, including publications, authors, institutions, and more.",
-}
 
-for tool, description in automation_tools.items():
-    tool_uri = BASE[tool.replace(" ", "_")]
-    g.add((tool_uri, RDF.type, FOAF.Agent))
-    g.add((tool_uri, RDFS.label, Literal(tool, lang="en")))
-    g.add((tool_uri, RDFS.comment, Literal(description, lang="en")))
-    
 def mapAutomationTool(tool_name):
     """Map automation tool to ontology terms."""
     if pd.isna(tool_name):
         return None
     tool_name = tool_name.strip()
     tool_uri = BASE[tool_name.replace(" ", "_")]
-    if (tool_uri, RDF.type, FOAF.Agent) in g:
+    if tool_uri in AUTOMATION_TOOL_URIS:
         return tool_uri
     return None
 
@@ -197,18 +145,34 @@ for prop, uri in properties.items():
 df = pd.read_csv(input_url)
 # save to file
 df.to_csv("kpi_input.csv", index=False)
+# attribute-friendly column names for itertuples
+df = df.rename(columns={
+    "Indicator set": "IndicatorSet",
+    "Type of indicator": "TypeOfIndicator",
+    "Service Category": "ServiceCategory",
+    "Target Group": "TargetGroup",
+    "Measurement (tool/estimation etc)": "Measurement",
+    "Automation possible": "Automation",
+})
+# flatten multi-line descriptions once; an all-empty column parses as float64,
+# so cast to string first (missing cells become <NA>, skipped by add_literal)
+df["Description"] = df["Description"].astype("string").str.replace("\n", " ", regex=False)
 
 # === CONVERT EACH ROW ===
-for n, row in df.iterrows():
+# triples are collected and flushed in one addN call
+quads = []
+def E(s, p, o): quads.append((s, p, o, g))
+
+for row in df.itertuples(index=True, name="R"):
     # skip first two rows if they are headers
-    if n < 2:
+    if row.Index < 2:
         continue
     # Create a URI for each KPI
-    kpi_id = row["Indicator"].strip().replace(" ", "_").replace("/", "_")
+    kpi_id = row.Indicator.strip().replace(" ", "_").replace("/", "_")
     kpi_uri = BASE[kpi_id]
 
-    g.add((kpi_uri, RDF.type, BASE.Indicator))
-    g.add((kpi_uri, RDFS.label, Literal(row["Indicator"], lang="en")))
+    E(kpi_uri, RDF.type, BASE.Indicator)
+    E(kpi_uri, RDFS.label, Literal(row.Indicator, lang="en"))
 
     # Add all non-empty values as literals
     def add_literal(property_name, value, datatype=None):
@@ -217,48 +181,54 @@ for n, row in df.iterrows():
                 lit = Literal(value, datatype=datatype)
             else:
                 lit = Literal(value)
-            g.add((kpi_uri, properties[property_name], lit))
+            E(kpi_uri, properties[property_name], lit)
 
     val_type = (
         PATO["0103000"]
-        if row.get("Type of indicator") == "Quantitative"
+        if getattr(row, "TypeOfIndicator", None) == "Quantitative"
         else PATO["0000068"]
     )
-    tg = mapTargetGroup(row.get("Target Group"))
-    service = mapToolType(row.get("Service Category"))
-    add_literal("indicatorSet", row.get("Indicator set"))
-    add_literal("description", row.get("Description").replace("\n", " "))
+    target_group = getattr(row, "TargetGroup", None)
+    tg = mapTargetGroup(target_group if isinstance(target_group, str) else None)
+    service = mapToolType(getattr(row, "ServiceCategory", None))
+    add_literal("indicatorSet", getattr(row, "IndicatorSet", None))
+    add_literal("description", row.Description)
     if service:
         for svc in service:
             add_literal("serviceCategory", svc)
     add_literal("valueType", val_type)
-    add_literal("example", row.get("Example"))
+    add_literal("example", getattr(row, "Example", None))
     if tg:
         for group in tg:
             add_literal("targetGroup", group)
     add_literal(
         "mandatory",
-        row.get("Mandatory"),
+        getattr(row, "Mandatory", None),
         (
             XSD.boolean
-            if str(row.get("Mandatory")).lower() in ["true", "yes", "1", 'Yes']
+            if str(getattr(row, "Mandatory", None)).lower() in ["true", "yes", "1", 'Yes']
             else None
         ),
     )
-    add_literal("measurement", row.get("Measurement (tool/estimation etc)"))
-    add_literal("source", row.get("Source"))
-    if (row.get("Automation possible")):
-        for tool in str(row.get("Automation possible")).split(","):
+    add_literal("measurement", getattr(row, "Measurement", None))
+    add_literal("source", getattr(row, "Source", None))
+    # NaN is a truthy float; only split real cell text
+    automation = getattr(row, "Automation", None)
+    if isinstance(automation, str):
+        for tool in automation.split(","):
             tool_uri = mapAutomationTool(tool)
             if tool_uri:
-                g.add((kpi_uri, properties["automationTool"], tool_uri))
+                E(kpi_uri, properties["automationTool"], tool_uri)
 
+    link = getattr(row, "Link", None)
     add_literal(
         "link",
-        row.get("Link"),
-        XSD.anyURI if str(row.get("Link")).startswith("http") else None,
+        link,
+        XSD.anyURI if isinstance(link, str) and link.startswith("http") else None,
     )
 
+g.addN(quads)
+
 # === SAVE TTL ===
 g.serialize(destination=output_file, format="turtle")
 print(f"KPI ontology exported to {output_file}")
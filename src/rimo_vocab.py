@@ -0,0 +1,82 @@
+"""
+Shared RIMO vocabulary: service categories (bio.tools tool types), target
+groups and automation tools, plus the sheet spellings that alias them.
+
+Used by both sheet_to_base_ttl.py and the legacy .old/sheet_to_ttl.py.
+"""
+
+from rdflib import Literal, RDF
+from rdflib.namespace import RDFS, FOAF
+
+# Define a set of tool types
+TOOL_TYPES = {
+    "Bioinformatics portal": "web site providing a platform/portal to multiple resources used for research in a focused area, including biological databases, web applications, training resources and so on.",
+    "Command-line tool": "A tool with a text-based (command-line) interface.",
+    "Database portal": "A Web application, suite or workbench providing a portal to a biological database.",
+    "Desktop application": "A tool with a graphical user interface that runs on your desktop environment, e.g. on a PC or mobile device.",
+    "Library": "A collection of components that are used to construct other tools. bio.tools scope includes component libraries performing high-level bioinformatics functions but excludes lower-level programming libraries.",
+    "Ontology": "A collection of information about concepts, including terms, synonyms, descriptions etc.",
+    "Plug-in": "A software component encapsulating a set of related functions, which are not standalone, i.e. depend upon other software for its use, e.g. a Javascript widget, or a plug-in, extension add-on etc. that extends the function of some existing tool.",
+    "Script": "A tool written for some run-time environment (e.g. other applications or an OS shell) that automates the execution of tasks. Often a small program written in a general-purpose languages (e.g. Perl, Python) or some domain-specific languages (e.g. sed).",
+    "SPARQL endpoint": "A service that provides queries over an RDF knowledge base via the SPARQL query language and protocol, and returns results via HTTP.",
+    "Suite": "A collection of tools which are bundled together into a convenient toolkit. Such tools typically share related functionality, a common user interface and can exchange data conveniently. This includes collections of stand-alone command-line tools, or Web applications within a common portal.",
+    "Web application": "A tool with a graphical user interface that runs in your Web browser.",
+    "Web API": "An application programming interface (API) consisting of endpoints to a request-response message system accessible via HTTP. Includes everything from simple data-access URLs to RESTful APIs.",
+    "Web service": "An API described in a machine readable form (typically WSDL) providing programmatic access via SOAP over HTTP.",
+    "Workbench": "An application or suite with a graphical user interface, providing an integrated environment for data analysis which includes or may be extended with any number of functions or tools. Includes workflow systems, platforms, frameworks etc.",
+    "Workflow": "A set of tools which have been composed together into a pipeline of some sort. Such tools are (typically) standalone, but are composed for convenience, for instance for batch execution via some workflow engine or script.",
+    "Helpdesk": "A service providing assistance with the use of bioinformatics tools, data resources, or any other aspect of bioinformatics.",
+}
+
+# Target Group terms
+TARGET_GROUPS = {
+    "Funding Agency": "An organization that provides funding for research activities.",
+    "Service Provider": "An organization or individual that offers services to users or clients.",
+    "End User": "The individual or group that ultimately uses or is intended to use a product or service.",
+    "Network": "A group or system of interconnected people or organizations that collaborate or share resources.",
+    "Technical": "Individuals or teams responsible for the technical aspects of service delivery, including maintenance and support.",
+}
+
+AUTOMATION_TOOLS = {
+    "Matomo": "An open-source web analytics platform.",
+    "Google Analytics": "A web analytics service offered by Google that tracks and reports website traffic.",
+    "Bioconductor": "An open-source software project for the analysis and comprehension of genomic data.",
+    "Galaxy": "An open, web-based platform for data-intensive biomedical research.",
+    "GitHub": "A web-based platform used for version control and collaborative software development.",
+    "Custom scripts": "User-defined scripts created for specific tasks or analyses.",
+    "OpenAlex": "An open catalog of the global research system, including publications, authors, institutions, and more.",
+}
+
+# sheet spellings that don't match a tool type directly (local names)
+ALIAS_MAP = {
+    "Web applications": ["Web_application"],
+    "Database": ["Database_portal"],
+    "Libraries / APIs": ["Library", "Web_API"],
+    "Support / Consulting": ["Helpdesk"],
+    "Tools/ Applications": ["Desktop_application"],
+    "Workflows / pipelines": ["Workflow"],
+}
+
+
+def term(base, label):
+    """URI of a vocabulary label in namespace base."""
+    return base[label.replace(" ", "_")]
+
+
+def register_vocab(g, base):
+    """Add service categories, target groups and automation tools to g."""
+    for tool_type, description in TOOL_TYPES.items():
+        tool_uri = term(base, tool_type)
+        g.add((tool_uri, RDF.type, base.ServiceCategory))
+        g.add((tool_uri, RDFS.label, Literal(tool_type, lang="en")))
+        g.add((tool_uri, RDFS.comment, Literal(description, lang="en")))
+    for group, description in TARGET_GROUPS.items():
+        group_uri = term(base, group)
+        g.add((group_uri, RDF.type, FOAF.Group))
+        g.add((group_uri, RDFS.label, Literal(group, lang="en")))
+        g.add((group_uri, RDFS.comment, Literal(description, lang="en")))
+    for tool, description in AUTOMATION_TOOLS.items():
+        tool_uri = term(base, tool)
+        g.add((tool_uri, RDF.type, FOAF.Agent))
+        g.add((tool_uri, RDFS.label, Literal(tool, lang="en")))
+        g.add((tool_uri, RDFS.comment, Literal(description, lang="en")))
@@ -1,22 +1,54 @@
+import hashlib
+import os
+import pickle
+import time
+import warnings
+from email.utils import formatdate
+from itertools import repeat
+
 import pandas as pd
+import requests
 from rdflib import Graph, Namespace, URIRef, Literal, RDF, RDFS, XSD
 from rdflib.namespace import FOAF, OWL, DCTERMS
+from rdflib.plugins.stores.memory import SimpleMemory
+
+from rimo_vocab import TOOL_TYPES, ALIAS_MAP, term
 
 BASE_TTL = "RIMO.ttl"
 # CSV_FILE = "kpis.csv"
 INPUT_URL = "http://docs.google.com/spreadsheets/d/1-pdz4O9cD8Xzy0ZbZbEQ3bSEn6k6hmlihqN6zG0kHeU/export?format=csv"
 DATA_TTL = "KPIs.ttl"
+CACHE_DIR = ".cache"
+# write line-based N-Triples instead of pretty Turtle (no sorting/grouping pass);
+# convert to Turtle afterwards for releases, e.g. `riot --output=ttl KPIs.nt`
+FAST_SERIALIZE = False
+
+def load_base_namespaces(path):
+    """Prefix bindings of the base ontology, cached in CACHE_DIR until path changes."""
+    cache = os.path.join(CACHE_DIR, "base.pkl")
+    sig = os.path.getmtime(path)
+    if os.path.exists(cache):
+        with open(cache, "rb") as f:
+            cached_sig, namespaces = pickle.load(f)
+        if cached_sig == sig:
+            return namespaces
+    base = Graph()
+    base.parse(path, format="turtle")
+    namespaces = list(base.namespaces())
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(cache, "wb") as f:
+        pickle.dump((sig, namespaces), f)
+    return namespaces
 
-# Load BASE to copy/bind prefixes, but don't mutate it
-base = Graph()
-base.parse(BASE_TTL, format="turtle")
+# Load BASE prefixes to copy/bind; BASE itself is never mutated
+namespaces = load_base_namespaces(BASE_TTL)
 
-# New data graph that imports BASE
-data = Graph()
-for pfx, ns in base.namespaces():
+# New data graph that imports BASE; write-only, so the context-free store suffices
+data = Graph(store=SimpleMemory())
+for pfx, ns in namespaces:
     data.bind(pfx, ns)
 
-RIMO = Namespace(dict(base.namespaces()).get("rimo","https://w3id.org/RIMO#"))
+RIMO = Namespace(dict(namespaces).get("rimo","https://w3id.org/RIMO#"))
 data.bind("rimo", RIMO)
 
 # Add owl:imports triple
@@ -28,135 +60,209 @@ data.add((DATA_ONTO, DCTERMS.title, Literal("RIMO KPI Instances", lang="en")))
 
 # Helpers
 import re
-def slug(s): return re.sub(r"[^a-z0-9]+","_",str(s).strip().lower()).strip("_")
+from functools import lru_cache
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_SPLIT_RE = re.compile(r"[^a-zA-Z0-9]+")
+def slug(s): return _SLUG_RE.sub("_", str(s).strip().lower()).strip("_")
 def slugcamel(s):
     # upper camel case from string
-    parts = re.split(r"[^a-zA-Z0-9]+", str(s).strip())
+    parts = _SPLIT_RE.split(str(s).strip())
     return "".join(p.capitalize() for p in parts if p)
+_NULL_STRS = frozenset({"nan", "na", "<na>", "none", ""})
 def lit(v, lang=None, dt=None):
-    if v is None or str(v).strip()=="" or pd.isna(v):
+    if v is None:
+        return None
+    # str cells can't be NaN, only non-str values need pd.isna()
+    is_str = isinstance(v, str)
+    s = (v if is_str else str(v)).strip()
+    if not s or (not is_str and pd.isna(v)):
         return None
     if not dt:
-        s = str(v).strip()
-        if not s or s.lower() in {"nan", "na", "<na>", "none"}:
+        if s.lower() in _NULL_STRS:
             return None
         return Literal(s, lang=lang)
-    return Literal(v, lang=lang) if dt is None and lang else Literal(v, datatype=dt) if dt else Literal(v)
-
-# Define a set of tool types
-tool_types = {
-    "Bioinformatics portal": "web site providing a platform/portal to multiple resources used for research in a focused area, including biological databases, web applications, training resources and so on.",
-    "Command-line tool": "A tool with a text-based (command-line) interface.",
-    "Database portal": "A Web application, suite or workbench providing a portal to a biological database.",
-    "Desktop application": "A tool with a graphical user interface that runs on your desktop environment, e.g. on a PC or mobile device.",
-    "Library": "A collection of components that are used to construct other tools. bio.tools scope includes component libraries performing high-level bioinformatics functions but excludes lower-level programming libraries.",
-    "Ontology": "A collection of information about concepts, including terms, synonyms, descriptions etc.",
-    "Plug-in": "A software component encapsulating a set of related functions, which are not standalone, i.e. depend upon other software for its use, e.g. a Javascript widget, or a plug-in, extension add-on etc. that extends the function of some existing tool.",
-    "Script": "A tool written for some run-time environment (e.g. other applications or an OS shell) that automates the execution of tasks. Often a small program written in a general-purpose languages (e.g. Perl, Python) or some domain-specific languages (e.g. sed).",
-    "SPARQL endpoint": "A service that provides queries over an RDF knowledge base via the SPARQL query language and protocol, and returns results via HTTP.",
-    "Suite": "A collection of tools which are bundled together into a convenient toolkit. Such tools typically share related functionality, a common user interface and can exchange data conveniently. This includes collections of stand-alone command-line tools, or Web applications within a common portal.",
-    "Web application": "A tool with a graphical user interface that runs in your Web browser.",
-    "Web API": "An application programming interface (API) consisting of endpoints to a request-response message system accessible via HTTP. Includes everything from simple data-access URLs to RESTful APIs.",
-    "Web service": "An API described in a machine readable form (typically WSDL) providing programmatic access via SOAP over HTTP.",
-    "Workbench": "An application or suite with a graphical user interface, providing an integrated environment for data analysis which includes or may be extended with any number of functions or tools. Includes workflow systems, platforms, frameworks etc.",
-    "Workflow": "A set of tools which have been composed together into a pipeline of some sort. Such tools are (typically) standalone, but are composed for convenience, for instance for batch execution via some workflow engine or script.",
-    "Helpdesk": "A service providing assistance with the use of bioinformatics tools, data resources, or any other aspect of bioinformatics.",
-}
+    return Literal(v, datatype=dt)
+
+# Means, tools and agents repeat across rows; share one term per key
+@lru_cache(maxsize=None)
+def _uri(prefix, key): return RIMO[prefix + slugcamel(key)]
+@lru_cache(maxsize=None)
+def _label(text, lang=None): return Literal(text, lang=lang)
+
+_KPI_T = (RDF.type, RIMO.KPI)
+_TRUE = Literal(True, datatype=XSD.boolean)
+_FALSE = Literal(False, datatype=XSD.boolean)
+_MAND_TRUE = frozenset({"yes","true","1"})
+_MAND_FALSE = frozenset({"no","false","0"})
+
+SERVICE_CAT_URIS = {term(RIMO, k) for k in TOOL_TYPES}
+SERVICE_CAT_ALIASES = {k: [RIMO[n] for n in v] for k, v in ALIAS_MAP.items()}
 def toolcat(service_category):
     """Map service category to ontology terms."""
-    if pd.isna(service_category):
+    if not service_category:
         return None
     service_category = service_category.strip()
     tool_uri = RIMO[service_category.replace(" ", "_")]
-    if (tool_uri, RDF.type, RIMO.ServiceCategory) in data:
+    if tool_uri in SERVICE_CAT_URIS:
         return [tool_uri]
-    if service_category == "Web applications":
-        return [RIMO.Web_application]
-    if service_category == "Database":
-        return [RIMO.Database_portal]
-    if service_category == "Libraries / APIs":
-        return [RIMO.Library, RIMO.Web_API]
-    if service_category == "Support / Consulting":
-        return [RIMO.Helpdesk]
-    if service_category == "Tools/ Applications":
-        return [RIMO.Desktop_application]
-    if service_category == "Workflows / pipelines":
-        return [RIMO.Workflow]
-    return None
-
-df = pd.read_csv(INPUT_URL)
+    return SERVICE_CAT_ALIASES.get(service_category, None)
+
+def fetch_csv(url):
+    """Download url into CACHE_DIR, revalidating an existing copy via ETag/If-Modified-Since."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    cache = os.path.join(CACHE_DIR, hashlib.sha1(url.encode()).hexdigest() + ".csv")
+    headers = {}
+    if os.path.exists(cache):
+        headers["If-Modified-Since"] = formatdate(os.path.getmtime(cache), usegmt=True)
+        if os.path.exists(cache + ".etag"):
+            with open(cache + ".etag") as f:
+                headers["If-None-Match"] = f.read().strip()
+    try:
+        r = requests.get(url, headers=headers, timeout=30)
+        r.raise_for_status()
+    except requests.RequestException as e:
+        # offline or sheet unavailable: fall back to the last download, loudly
+        if os.path.exists(cache):
+            age_h = (time.time() - os.path.getmtime(cache)) / 3600
+            warnings.warn(f"Could not fetch {url} ({e}); using cached {cache} from {age_h:.1f} h ago")
+            return cache
+        raise
+    if r.status_code == 304:
+        return cache
+    with open(cache, "wb") as f:
+        f.write(r.content)
+    etag = r.headers.get("ETag")
+    if etag:
+        with open(cache + ".etag", "w") as f:
+            f.write(etag)
+    elif os.path.exists(cache + ".etag"):
+        os.remove(cache + ".etag")
+    return cache
+
+def read_sheet(csv_path):
+    """Parse csv_path, reusing a pickled DataFrame while it is newer than the CSV."""
+    pkl = csv_path + ".pkl"
+    if os.path.exists(pkl) and os.path.getmtime(pkl) >= os.path.getmtime(csv_path):
+        return pd.read_pickle(pkl)
+    # default C engine: pyarrow's reader breaks quoted multi-line cells that span its ~1 MB blocks
+    df = pd.read_csv(csv_path, dtype_backend="pyarrow")
+    df.to_pickle(pkl)
+    return df
+
+df = read_sheet(fetch_csv(INPUT_URL))
+# attribute-friendly column names for itertuples
+df = df.rename(columns={
+    "Indicator set": "IndicatorSet",
+    "Type of indicator": "TypeOfIndicator",
+    "Service Category": "ServiceCategory",
+    "Target Group": "TargetGroup",
+    "Measurement (tool/estimation etc)": "Measurement",
+    "Automation possible": "Automation",
+})
+# optional columns may be missing from the sheet; treat them as all-empty
+OPTIONAL_COLUMNS = ["Description", "TypeOfIndicator", "ServiceCategory", "Example", "Mandatory",
+                    "Measurement", "Automation", "TargetGroup", "Link"]
+df = df.assign(**{col: "" for col in OPTIONAL_COLUMNS if col not in df})
+# skip first two rows (headers) and rows without an indicator name
+df = df.iloc[2:].copy()
+df["Indicator"] = df["Indicator"].astype("string[pyarrow]").str.strip()
+df = df[df["Indicator"].notna() & (df["Indicator"] != "")]
+# Arrow-backed, stripped text with "" for missing cells, so the row loop
+# needs no pd.isna()/str() guards. Empty Measurement/Target Group cells are
+# skipped instead of becoming the string "nan" (rimo:means/Nan, rimo:agent/Nan)
+for col in OPTIONAL_COLUMNS:
+    df[col] = df[col].astype("string[pyarrow]").str.strip().fillna("")
+# vectorized per-row normalisation; no leading underscores, itertuples would rename them
+df["Desc"] = df["Description"].str.replace(r"\s+", " ", regex=True)
+indicator_type = df["TypeOfIndicator"].str.lower()
+df["IsQualitative"] = indicator_type.str.contains("qualit")
+df["IsQuantitative"] = indicator_type.str.contains("quant")
+df["MandatoryNorm"] = df["Mandatory"].str.lower()
+df["HasLink"] = df["Link"].str.startswith("http")
+
+def tokens(col):
+    """Comma-separated cells of col as {row index: [token, ...]}, split once up front."""
+    long = df[col].str.split(",").explode().str.strip()
+    long = long[long != ""]
+    return long.groupby(level=0).agg(list).to_dict()
+
+auto_tokens = tokens("Automation")
+tg_tokens = tokens("TargetGroup")
+
 # Build instances
-for n, row in df.iterrows():
-    # skip first two rows if they are headers
-    if n < 2:
-        continue
-    name = str(row.get("Indicator","")).strip()
-    if not name:
-        continue
-    kpi = RIMO[slugcamel(name)]
-
-    data.add((kpi, RDF.type, RIMO.KPI))
-    data.add((kpi, RIMO.name, Literal(name, lang="en")))
-
-    d = lit(row.get("Description").replace("\n", " ").replace("  ", " "), lang="en")
-    if d: data.add((kpi, RIMO.description, d))
-    if row.get("Example"):
-        ex = lit(row.get("Example"), lang="en")
-        if ex: data.add((kpi, RIMO.example, ex))
-
-    # qualitative flag
-    t = str(row.get("Type of indicator","")).lower()
-    if "qualit" in t:
-        data.add((kpi, RIMO.isQualitativeIndicator, Literal(True, datatype=XSD.boolean)))
-    elif "quant" in t:
-        data.add((kpi, RIMO.isQualitativeIndicator, Literal(False, datatype=XSD.boolean)))
-
-    # tool category relations
-    category = toolcat(row.get("Service Category"))
-    if category:
-        for cat in category:
-            data.add((kpi, RIMO.appliedTo, cat))
-            mand = str(row.get("Mandatory","")).strip().lower()
-            if mand in {"yes","true","1"}:
-                data.add((kpi, RIMO.mandatoryFor, cat))
-            elif mand in {"no","false","0"}:
-                data.add((kpi, RIMO.recommendedFor, cat))
-
-    # means of measurement
-    means = str(row.get("Measurement (tool/estimation etc)","")).strip()
-    if means:
-        mm = RIMO["means/" + slugcamel(means)]
-        data.add((mm, RDF.type, RIMO.MeasurementMeans))
-        data.add((mm, RDFS.label, Literal(means, lang="en")))
-        data.add((kpi, RIMO.measuredBy, mm))
-
-    # automation tools (comma-separated)
-    auto = row.get("Automation possible")
-    if pd.notna(auto):
-        for tok in str(auto).split(","):
-            tool = tok.strip()
-            if not tool: continue
-            at = RIMO["tool/" + slugcamel(tool)]
-            data.add((at, RDF.type, RIMO.AutomationTool))
-            data.add((at, RDFS.label, Literal(tool)))
-            data.add((kpi, RIMO.canBeAutomatedBy, at))
-
-    # requester (Target Group as free text Agent)
-    for tgt in str(row.get("Target Group") or "").split(","):
-        tgt = tgt.strip()
-        if not tgt:
-            continue
-        ag = RIMO["agent/" + slugcamel(tgt)]
-        data.add((ag, RDF.type, FOAF.Agent))
-        data.add((ag, RDFS.label, Literal(tgt)))
-        data.add((kpi, RIMO.requestedBy, ag))
-
-    # source + link as literals
-    link = str(row.get("Link") or "")
-    if link.startswith("http"):
-        data.add((kpi, DCTERMS.relation, URIRef(link)))
+def process_chunk(chunk):
+    """Build the triples for a slice of sheet rows as parallel subject/predicate/object lists."""
+    subs, preds, objs = [], [], []
+    add_s, add_p, add_o = subs.append, preds.append, objs.append
+    def E(s, p, o): add_s(s); add_p(p); add_o(o)
+
+    for row in chunk.itertuples(index=True, name="R"):
+        name = row.Indicator
+        # names are unique per row, so they bypass the _uri/_label caches
+        kpi = RIMO[slugcamel(name)]
+
+        E(kpi, *_KPI_T)
+        E(kpi, RIMO.name, Literal(name, lang="en"))
+
+        d = lit(row.Desc, lang="en")
+        if d: E(kpi, RIMO.description, d)
+        if row.Example:
+            ex = lit(row.Example, lang="en")
+            if ex: E(kpi, RIMO.example, ex)
+
+        # qualitative flag
+        if row.IsQualitative:
+            E(kpi, RIMO.isQualitativeIndicator, _TRUE)
+        elif row.IsQuantitative:
+            E(kpi, RIMO.isQualitativeIndicator, _FALSE)
+
+        # tool category relations
+        category = toolcat(row.ServiceCategory)
+        if category:
+            mand = row.MandatoryNorm
+            for cat in category:
+                E(kpi, RIMO.appliedTo, cat)
+                if mand in _MAND_TRUE:
+                    E(kpi, RIMO.mandatoryFor, cat)
+                elif mand in _MAND_FALSE:
+                    E(kpi, RIMO.recommendedFor, cat)
+
+        # means of measurement
+        means = row.Measurement
+        if means:
+            mm = _uri("means/", means)
+            E(mm, RDF.type, RIMO.MeasurementMeans)
+            E(mm, RDFS.label, _label(means, "en"))
+            E(kpi, RIMO.measuredBy, mm)
+
+        # automation tools (comma-separated)
+        for tool in auto_tokens.get(row.Index, ()):
+            at = _uri("tool/", tool)
+            E(at, RDF.type, RIMO.AutomationTool)
+            E(at, RDFS.label, _label(tool))
+            E(kpi, RIMO.canBeAutomatedBy, at)
+
+        # requester (Target Group as free text Agent)
+        for tgt in tg_tokens.get(row.Index, ()):
+            ag = _uri("agent/", tgt)
+            E(ag, RDF.type, FOAF.Agent)
+            E(ag, RDFS.label, _label(tgt))
+            E(kpi, RIMO.requestedBy, ag)
+
+        # source + link as literals
+        if row.HasLink:
+            E(kpi, DCTERMS.relation, URIRef(row.Link))
+
+    return subs, preds, objs
 
+subs, preds, objs = process_chunk(df)
+data.addN(zip(subs, preds, objs, repeat(data)))
 
 # Serialize only instances + imports
-data.serialize(DATA_TTL, format="turtle")
-print(f"✅ Wrote {DATA_TTL} (imports BASE)")
\ No newline at end of file
+if FAST_SERIALIZE:
+    out = DATA_TTL.replace(".ttl", ".nt")
+    data.serialize(out, format="nt", encoding="utf-8")
+else:
+    out = DATA_TTL
+    data.serialize(out, format="turtle")
+print(f"✅ Wrote {out} (imports BASE)")
\ No newline at end of file